@@ -1,25 +1,4 @@
-from .adabelief import AdaBelief
-from .adafactor import Adafactor
-from .adafactor_bv import AdafactorBigVision
-from .adahessian import Adahessian
-from .adamp import AdamP
-from .adamw import AdamWLegacy
-from .adan import Adan
-from .adopt import Adopt
-from .lamb import Lamb
-from .laprop import LaProp
-from .lars import Lars
-from .lion import Lion
-from .lookahead import Lookahead
-from .madgrad import MADGRAD
-from .mars import Mars
-from .nadam import NAdamLegacy
-from .nadamw import NAdamW
-from .nvnovograd import NvNovoGrad
-from .radam import RAdamLegacy
-from .rmsprop_tf import RMSpropTF
-from .sgdp import SGDP
-from .sgdw import SGDW
+from typing import TYPE_CHECKING
 
 # bring common torch.optim Optimizers into timm.optim namespace for consistency
 from torch.optim import Adadelta, Adagrad, Adamax, Adam, AdamW, RMSprop, SGD
@@ -32,3 +11,69 @@ except ImportError:
 from ._optim_factory import list_optimizers, get_optimizer_class, get_optimizer_info, OptimInfo, OptimizerRegistry, \
     create_optimizer_v2, create_optimizer, optimizer_kwargs
 from ._param_groups import param_groups_layer_decay, param_groups_weight_decay, auto_group_layers
+
+# timm optimizer implementations, re-exported lazily (PEP 562) so importing timm.optim does not
+# load every optimizer module; each is imported on first attribute access
+_LAZY_IMPORTS = {
+    'AdaBelief': '.adabelief',
+    'Adafactor': '.adafactor',
+    'AdafactorBigVision': '.adafactor_bv',
+    'Adahessian': '.adahessian',
+    'AdamP': '.adamp',
+    'AdamWLegacy': '.adamw',
+    'Adan': '.adan',
+    'Adopt': '.adopt',
+    'Lamb': '.lamb',
+    'LaProp': '.laprop',
+    'Lars': '.lars',
+    'Lion': '.lion',
+    'Lookahead': '.lookahead',
+    'MADGRAD': '.madgrad',
+    'Mars': '.mars',
+    'NAdamLegacy': '.nadam',
+    'NAdamW': '.nadamw',
+    'NvNovoGrad': '.nvnovograd',
+    'RAdamLegacy': '.radam',
+    'RMSpropTF': '.rmsprop_tf',
+    'SGDP': '.sgdp',
+    'SGDW': '.sgdw',
+}
+
+if TYPE_CHECKING:
+    # eager imports for static analysis / IDEs, mirror _LAZY_IMPORTS exactly
+    from .adabelief import AdaBelief
+    from .adafactor import Adafactor
+    from .adafactor_bv import AdafactorBigVision
+    from .adahessian import Adahessian
+    from .adamp import AdamP
+    from .adamw import AdamWLegacy
+    from .adan import Adan
+    from .adopt import Adopt
+    from .lamb import Lamb
+    from .laprop import LaProp
+    from .lars import Lars
+    from .lion import Lion
+    from .lookahead import Lookahead
+    from .madgrad import MADGRAD
+    from .mars import Mars
+    from .nadam import NAdamLegacy
+    from .nadamw import NAdamW
+    from .nvnovograd import NvNovoGrad
+    from .radam import RAdamLegacy
+    from .rmsprop_tf import RMSpropTF
+    from .sgdp import SGDP
+    from .sgdw import SGDW
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    from importlib import import_module
+    attr = getattr(import_module(module_name, __name__), name)
+    globals()[name] = attr  # cache so later accesses bypass __getattr__
+    return attr
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
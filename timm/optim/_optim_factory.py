@@ -3,11 +3,12 @@
 Hacked together by / Copyright 2021 Ross Wightman
 """
 import logging
-from dataclasses import dataclass
-from functools import partial
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
-from fnmatch import fnmatch
+import sys
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Type, Union
+from fnmatch import translate
 import importlib
+import re
 
 import torch
 import torch.nn as nn
@@ -15,45 +16,59 @@ import torch.optim
 
 from ._param_groups import param_groups_layer_decay, param_groups_weight_decay
 from ._types import ParamsT, OptimType, OptimizerCallable
-from .adabelief import AdaBelief
-from .adafactor import Adafactor
-from .adafactor_bv import AdafactorBigVision
-from .adahessian import Adahessian
-from .adamp import AdamP
-from .adamw import AdamWLegacy
-from .adan import Adan
-from .adopt import Adopt
-from .kron import Kron
-from .lamb import Lamb
-from .laprop import LaProp
-from .lars import Lars
-from .lion import Lion
-from .lookahead import Lookahead
-from .madgrad import MADGRAD
-from .mars import Mars
-from .nadam import NAdamLegacy
-from .nadamw import NAdamW
-from .nvnovograd import NvNovoGrad
-from .radam import RAdamLegacy
-from .rmsprop_tf import RMSpropTF
-from .sgdp import SGDP
-from .sgdw import SGDW
 
 _logger = logging.getLogger(__name__)
 
+# Resolve timm optimizer classes from dotted strings on first use instead of importing every
+# implementation at module load. Can be disabled (e.g. for tests) to register classes eagerly.
+_LAZY = True
 
+
+@lru_cache(maxsize=None)
+def _compile_glob(*patterns: str) -> 're.Pattern':
+    """Compile one or more wildcard patterns into a single cached alternation regex."""
+    return re.compile('|'.join(f'(?:{translate(p)})' for p in patterns))
+
+
+@lru_cache(maxsize=None)
 def _import_class(class_string: str) -> Type:
-    """Dynamically import a class from a string."""
+    """Dynamically import a class from a string, caching resolved classes."""
+    module_name, sep, class_name = class_string.rpartition(".")
+    if not sep:
+        raise ImportError(f"Could not import {class_string}: not a dotted class path")
     try:
-        module_name, class_name = class_string.rsplit(".", 1)
         module = importlib.import_module(module_name)
         return getattr(module, class_name)
     except (ImportError, AttributeError) as e:
         raise ImportError(f"Could not import {class_string}: {e}")
 
 
+@lru_cache(maxsize=None)
+def _require_cuda(for_what: str) -> None:
+    """Assert CUDA availability, memoized as torch.cuda.is_available() dispatches into the C++ layer."""
+    assert torch.cuda.is_available(), f'CUDA required for {for_what} optimizers'
+
+
+# Optimizer request strings are an optional 'lookahead_' prefix followed by a base name
+# taken from the last '_' separated segment, e.g. 'lookahead_adamw' -> ('adamw', True).
+_opt_name_re = re.compile(r'(?i)^(lookahead_)?(?:.+_)?([^_]+)$')
+
+
+@lru_cache(maxsize=None)
+def _parse_opt_name(opt: str) -> Tuple[str, bool]:
+    """Split an optimizer request string into (base name, lookahead flag), caching repeat requests."""
+    m = _opt_name_re.match(opt)
+    if not m:
+        return opt.lower(), False
+    return m.group(2).lower(), bool(m.group(1))
+
+
+def _opt_class(class_string: str) -> Union[str, Type]:
+    """Return a lazy (dotted string) reference to an optimizer class, or the resolved class if lazy
+    imports are disabled. Strings are resolved by `get_optimizer_class` via `_import_class`."""
+    return class_string if _LAZY else _import_class(class_string)
+
 
-@dataclass(frozen=True)
 class OptimInfo:
     """Immutable configuration for an optimizer.
 
@@ -67,15 +82,72 @@ class OptimInfo:
         num_betas: number of betas in tuple (valid IFF has_betas = True)
         defaults: Optional default parameters for the optimizer
     """
-    name: str
-    opt_class: Union[str, OptimType]
-    description: str = ''
-    has_eps: bool = True
-    has_momentum: bool = False
-    has_betas: bool = False
-    num_betas: int = 2
-    second_order: bool = False
-    defaults: Optional[Dict[str, Any]] = None
+    __slots__ = (
+        'name', 'opt_class', 'description', 'has_eps', 'has_momentum', 'has_betas',
+        'num_betas', 'second_order', 'defaults', 'arg_exclude',
+    )
+
+    def __init__(
+            self,
+            name: str,
+            opt_class: Union[str, OptimType],
+            description: str = '',
+            has_eps: bool = True,
+            has_momentum: bool = False,
+            has_betas: bool = False,
+            num_betas: int = 2,
+            second_order: bool = False,
+            defaults: Optional[Dict[str, Any]] = None,
+    ):
+        sa = object.__setattr__
+        sa(self, 'name', name)
+        sa(self, 'opt_class', opt_class)
+        sa(self, 'description', description)
+        sa(self, 'has_eps', has_eps)
+        sa(self, 'has_momentum', has_momentum)
+        sa(self, 'has_betas', has_betas)
+        sa(self, 'num_betas', num_betas)
+        sa(self, 'second_order', second_order)
+        sa(self, 'defaults', defaults)
+        # Precompute the commonly passed kwargs this optimizer does not accept, so argument
+        # finalization in create_optimizer is a single filter instead of per-key branches.
+        exclude = set()
+        if not has_eps:
+            exclude.add('eps')
+        if not has_betas:
+            exclude.add('betas')
+        sa(self, 'arg_exclude', frozenset(exclude))
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"cannot assign to field '{key}', OptimInfo is immutable")
+
+    def __delattr__(self, key):
+        raise AttributeError(f"cannot delete field '{key}', OptimInfo is immutable")
+
+    def __getstate__(self):
+        return tuple(getattr(self, k) for k in self.__slots__)
+
+    def __setstate__(self, state):
+        # restore via object.__setattr__, the default slot restore path goes through the
+        # raising __setattr__ and would break pickle / copy / deepcopy
+        for k, v in zip(self.__slots__, state):
+            object.__setattr__(self, k, v)
+
+    def _fields(self):
+        # declared fields only, excluding the derived arg_exclude slot
+        return tuple(getattr(self, k) for k in self.__slots__[:-1])
+
+    def __eq__(self, other):
+        if other.__class__ is self.__class__:
+            return self._fields() == other._fields()
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._fields())
+
+    def __repr__(self):
+        fields = ', '.join(f'{k}={getattr(self, k)!r}' for k in self.__slots__[:-1])
+        return f'{self.__class__.__name__}({fields})'
 
 
 class OptimizerRegistry:
@@ -87,7 +159,7 @@ class OptimizerRegistry:
 
     def __init__(self) -> None:
         self._optimizers: Dict[str, OptimInfo] = {}
-        self._foreach_defaults: Set[str] = {'lion'}
+        self._foreach_defaults: FrozenSet[str] = frozenset({'lion'})
 
     def register(self, info: OptimInfo) -> None:
         """Register an optimizer configuration.
@@ -95,11 +167,22 @@ class OptimizerRegistry:
         Args:
             info: The OptimInfo configuration containing name, type and description
         """
-        name = info.name.lower()
+        name = sys.intern(info.name.lower())
         if name in self._optimizers:
             _logger.warning(f'Optimizer {name} already registered, overwriting')
         self._optimizers[name] = info
 
+    def bulk_register(self, infos: Iterable[OptimInfo]) -> None:
+        """Register many optimizer configurations at once.
+
+        Writes directly via dict.update, skipping the per-entry collision check
+        (and warning) in `register`, so intended for conflict-free batches.
+
+        Args:
+            infos: Iterable of OptimInfo configurations to register
+        """
+        self._optimizers.update((sys.intern(i.name.lower()), i) for i in infos)
+
     def register_alias(self, alias: str, target: str) -> None:
         """Register an alias for an existing optimizer.
 
@@ -110,14 +193,14 @@ class OptimizerRegistry:
         Raises:
             KeyError: If target optimizer doesn't exist
         """
-        target = target.lower()
+        target = sys.intern(target.lower())
         if target not in self._optimizers:
             raise KeyError(f'Cannot create alias for non-existent optimizer {target}')
-        self._optimizers[alias.lower()] = self._optimizers[target]
+        self._optimizers[sys.intern(alias.lower())] = self._optimizers[target]
 
     def register_foreach_default(self, name: str) -> None:
         """Register an optimizer as defaulting to foreach=True."""
-        self._foreach_defaults.add(name.lower())
+        self._foreach_defaults = self._foreach_defaults | {sys.intern(name.lower())}
 
     def list_optimizers(
             self,
@@ -142,14 +225,12 @@ class OptimizerRegistry:
                 filters = [filter]
             else:
                 filters = filter
-            filtered_names = set()
-            for f in filters:
-                filtered_names.update(n for n in names if fnmatch(n, f))
-            names = sorted(filtered_names)
+            include_re = _compile_glob(*filters)
+            names = [n for n in names if include_re.match(n)]
 
         if exclude_filters:
-            for exclude_filter in exclude_filters:
-                names = [n for n in names if not fnmatch(n, exclude_filter)]
+            exclude_re = _compile_glob(*exclude_filters)
+            names = [n for n in names if not exclude_re.match(n)]
 
         if with_description:
             return [(name, self._optimizers[name].description) for name in names]
@@ -168,7 +249,7 @@ class OptimizerRegistry:
         Raises:
             ValueError: If optimizer is not found
         """
-        name = name.lower()
+        name = sys.intern(name.lower())
         if name not in self._optimizers:
             raise ValueError(f'Optimizer {name} not found in registry')
         return self._optimizers[name]
@@ -202,13 +283,13 @@ class OptimizerRegistry:
         if isinstance(opt_info.opt_class, str):
             # Special handling for APEX and BNB optimizers
             if opt_info.opt_class.startswith('apex.'):
-                assert torch.cuda.is_available(), 'CUDA required for APEX optimizers'
+                _require_cuda('APEX')
                 try:
                     opt_class = _import_class(opt_info.opt_class)
                 except ImportError as e:
                     raise ImportError('APEX optimizers require apex to be installed') from e
             elif opt_info.opt_class.startswith('bitsandbytes.'):
-                assert torch.cuda.is_available(), 'CUDA required for bitsandbytes optimizers'
+                _require_cuda('bitsandbytes')
                 try:
                     opt_class = _import_class(opt_info.opt_class)
                 except ImportError as e:
@@ -218,10 +299,10 @@ class OptimizerRegistry:
         else:
             opt_class = opt_info.opt_class
 
-        # Return class or partial with defaults
+        # Return a partial only when there are defaults to bind, the raw class otherwise so
+        # downstream instantiation doesn't pay for an empty partial wrapper.
         if bind_defaults and opt_info.defaults:
-            opt_class = partial(opt_class, **opt_info.defaults)
-
+            return partial(opt_class, **opt_info.defaults)
         return opt_class
 
     def create_optimizer(
@@ -258,10 +339,18 @@ class OptimizerRegistry:
             ValueError: If optimizer not found or configuration invalid
         """
 
+        # Parse & validate optimizer name up front, before any (potentially expensive) model walk
+        opt_name, use_lookahead = _parse_opt_name(opt)
+        opt_info = self.get_optimizer_info(opt_name)
+
+        # Enable the multi-tensor foreach impl by default for optimizers registered as foreach-default
+        if foreach is None and opt_name in self._foreach_defaults:
+            foreach = True
+
         # Get parameters to optimize
         if isinstance(model_or_params, nn.Module):
             # Extract parameters from a nn.Module, build param groups w/ weight-decay and/or layer-decay applied
-            no_weight_decay = getattr(model_or_params, 'no_weight_decay', lambda: set())()
+            no_weight_decay = getattr(model_or_params, 'no_weight_decay', lambda: set())
 
             if param_group_fn:
                 # run custom fn to generate param groups from nn.Module
@@ -271,7 +360,7 @@ class OptimizerRegistry:
                     model_or_params,
                     weight_decay=weight_decay,
                     layer_decay=layer_decay,
-                    no_weight_decay_list=no_weight_decay,
+                    no_weight_decay_list=no_weight_decay(),
                     weight_decay_exclude_1d=weight_decay_exclude_1d,
                 )
                 weight_decay = 0.
@@ -279,7 +368,7 @@ class OptimizerRegistry:
                 params = param_groups_weight_decay(
                     model_or_params,
                     weight_decay=weight_decay,
-                    no_weight_decay_list=no_weight_decay,
+                    no_weight_decay_list=no_weight_decay(),
                 )
                 weight_decay = 0.
             else:
@@ -288,34 +377,20 @@ class OptimizerRegistry:
             # pass parameters / parameter groups through to optimizer
             params = model_or_params
 
-        # Parse optimizer name
-        opt_split = opt.lower().split('_')
-        opt_name = opt_split[-1]
-        use_lookahead = opt_split[0] == 'lookahead' if len(opt_split) > 1 else False
-
-        opt_info = self.get_optimizer_info(opt_name)
-
-        # Build optimizer arguments
-        opt_args: Dict[str, Any] = {'weight_decay': weight_decay, **kwargs}
+        # Build optimizer arguments in a single merge, explicit args take precedence over OptimInfo defaults
+        opt_args: Dict[str, Any] = {**(opt_info.defaults or {}), 'weight_decay': weight_decay, **kwargs}
 
         # Add LR to args, if None optimizer default is used, some optimizers manage LR internally if None.
         if lr is not None:
             opt_args['lr'] = lr
 
-        # Apply optimizer-specific settings
-        if opt_info.defaults:
-            for k, v in opt_info.defaults.items():
-                opt_args.setdefault(k, v)
-
         # timm has always defaulted momentum to 0.9 if optimizer supports momentum, keep for backward compat.
         if opt_info.has_momentum:
             opt_args.setdefault('momentum', momentum)
 
         # Remove commonly used kwargs that aren't always supported
-        if not opt_info.has_eps:
-            opt_args.pop('eps', None)
-        if not opt_info.has_betas:
-            opt_args.pop('betas', None)
+        if opt_info.arg_exclude:
+            opt_args = {k: v for k, v in opt_args.items() if k not in opt_info.arg_exclude}
 
         if foreach is not None:
             # Explicitly activate or deactivate multi-tensor foreach impl.
@@ -329,573 +404,525 @@ class OptimizerRegistry:
 
         # Apply Lookahead if requested
         if use_lookahead:
+            from .lookahead import Lookahead
             optimizer = Lookahead(optimizer)
 
         return optimizer
 
 
-def _register_sgd_variants(registry: OptimizerRegistry) -> None:
-    """Register SGD-based optimizers"""
-    sgd_optimizers = [
-        OptimInfo(
-            name='sgd',
-            opt_class=torch.optim.SGD,
-            description='torch.Optim Stochastic Gradient Descent (SGD) with Nesterov momentum',
-            has_eps=False,
-            has_momentum=True,
-            defaults={'nesterov': True}
-        ),
-        OptimInfo(
-            name='momentum',
-            opt_class=torch.optim.SGD,
-            description='torch.Optim Stochastic Gradient Descent (SGD) with classical momentum',
-            has_eps=False,
-            has_momentum=True,
-            defaults={'nesterov': False}
-        ),
-        OptimInfo(
-            name='sgdp',
-            opt_class=SGDP,
-            description='SGD with built-in projection to unit norm sphere',
-            has_momentum=True,
-            defaults={'nesterov': True}
-        ),
-        OptimInfo(
-            name='sgdw',
-            opt_class=SGDW,
-            description='SGD with decoupled weight decay and Nesterov momentum',
-            has_eps=False,
-            has_momentum=True,
-            defaults={'nesterov': True}
-        ),
-    ]
-    for opt in sgd_optimizers:
-        registry.register(opt)
-
-
-def _register_adam_variants(registry: OptimizerRegistry) -> None:
-    """Register Adam-based optimizers"""
-    adam_optimizers = [
-        OptimInfo(
-            name='adam',
-            opt_class=torch.optim.Adam,
-            description='torch.optim.Adam, Adaptive Moment Estimation',
-            has_betas=True
-        ),
-        OptimInfo(
-            name='adamw',
-            opt_class=torch.optim.AdamW,
-            description='torch.optim.AdamW, Adam with decoupled weight decay',
-            has_betas=True
-        ),
-        OptimInfo(
-            name='adamwlegacy',
-            opt_class=AdamWLegacy,
-            description='legacy impl of AdamW that pre-dates inclusion to torch.optim',
-            has_betas=True
-        ),
-        OptimInfo(
-            name='adamp',
-            opt_class=AdamP,
-            description='Adam with built-in projection to unit norm sphere',
-            has_betas=True,
-            defaults={'wd_ratio': 0.01, 'nesterov': True}
-        ),
-        OptimInfo(
-            name='nadam',
-            opt_class=torch.optim.NAdam,
-            description='torch.optim.NAdam, Adam with Nesterov momentum',
-            has_betas=True
-        ),
-        OptimInfo(
-            name='nadamlegacy',
-            opt_class=NAdamLegacy,
-            description='legacy impl of NAdam that pre-dates inclusion in torch.optim',
-            has_betas=True
-        ),
-        OptimInfo(
-            name='nadamw',
-            opt_class=NAdamW,
-            description='Adam with Nesterov momentum and decoupled weight decay, mlcommons/algorithmic-efficiency impl',
-            has_betas=True
-        ),
-        OptimInfo(
-            name='radam',
-            opt_class=torch.optim.RAdam,
-            description='torch.optim.RAdam, Rectified Adam with variance adaptation',
-            has_betas=True
-        ),
-        OptimInfo(
-            name='radamlegacy',
-            opt_class=RAdamLegacy,
-            description='legacy impl of RAdam that predates inclusion in torch.optim',
-            has_betas=True
-        ),
-        OptimInfo(
-            name='radamw',
-            opt_class=torch.optim.RAdam,
-            description='torch.optim.RAdamW, Rectified Adam with variance adaptation and decoupled weight decay',
-            has_betas=True,
-            defaults={'decoupled_weight_decay': True}
-        ),
-        OptimInfo(
-            name='adamax',
-            opt_class=torch.optim.Adamax,
-            description='torch.optim.Adamax, Adam with infinity norm for more stable updates',
-            has_betas=True
-        ),
-        OptimInfo(
-            name='adafactor',
-            opt_class=Adafactor,
-            description='Memory-efficient implementation of Adam with factored gradients',
-        ),
-        OptimInfo(
-            name='adafactorbv',
-            opt_class=AdafactorBigVision,
-            description='Big Vision variant of Adafactor with factored gradients, half precision momentum',
-        ),
-        OptimInfo(
-            name='adopt',
-            opt_class=Adopt,
-            description='Modified Adam that can converge with any β2 with the optimal rate',
-        ),
-        OptimInfo(
-            name='adoptw',
-            opt_class=Adopt,
-            description='Modified AdamW (decoupled decay) that can converge with any β2 with the optimal rate',
-            defaults={'decoupled': True}
-        ),
-    ]
-    for opt in adam_optimizers:
-        registry.register(opt)
-
-
-def _register_lamb_lars(registry: OptimizerRegistry) -> None:
-    """Register LAMB and LARS variants"""
-    lamb_lars_optimizers = [
-        OptimInfo(
-            name='lamb',
-            opt_class=Lamb,
-            description='Layer-wise Adaptive Moments for batch optimization',
-            has_betas=True
-        ),
-        OptimInfo(
-            name='lambc',
-            opt_class=Lamb,
-            description='LAMB with trust ratio clipping for stability',
-            has_betas=True,
-            defaults={'trust_clip': True}
-        ),
-        OptimInfo(
-            name='lambw',
-            opt_class=Lamb,
-            description='LAMB with decoupled weight decay',
-            has_betas=True,
-            defaults={'decoupled_decay': True}
-        ),
-        OptimInfo(
-            name='lambcw',
-            opt_class=Lamb,
-            description='LAMB with trust ratio clipping for stability and decoupled decay',
-            has_betas=True,
-            defaults={'trust_clip': True, 'decoupled_decay': True}
-        ),
-        OptimInfo(
-            name='lars',
-            opt_class=Lars,
-            description='Layer-wise Adaptive Rate Scaling',
-            has_momentum=True
-        ),
-        OptimInfo(
-            name='larc',
-            opt_class=Lars,
-            description='LARS with trust ratio clipping for stability',
-            has_momentum=True,
-            defaults={'trust_clip': True}
-        ),
-        OptimInfo(
-            name='nlars',
-            opt_class=Lars,
-            description='LARS with Nesterov momentum',
-            has_momentum=True,
-            defaults={'nesterov': True}
-        ),
-        OptimInfo(
-            name='nlarc',
-            opt_class=Lars,
-            description='LARS with Nesterov momentum & trust ratio clipping',
-            has_momentum=True,
-            defaults={'nesterov': True, 'trust_clip': True}
-        ),
-    ]
-    for opt in lamb_lars_optimizers:
-        registry.register(opt)
-
-
-def _register_cautious_optimizers(registry: OptimizerRegistry) -> None:
-    cautious_optimizers = [
-        OptimInfo(
-            name='cadafactor',
-            opt_class=Adafactor,
-            description='Cautious Adafactor',
-            defaults={'caution': True}
-        ),
-        OptimInfo(
-            name='cadafactorbv',
-            opt_class=AdafactorBigVision,
-            description='Cautious Big Vision Adafactor',
-            defaults={'caution': True}
-        ),
-        OptimInfo(
-            name='cadamw',
-            opt_class=AdamWLegacy,
-            description='Cautious AdamW',
-            has_betas=True,
-            defaults={'caution': True}
-        ),
-        OptimInfo(
-            name='cadopt',
-            opt_class=Adopt,
-            description='Cautious Adopt',
-            defaults={'caution': True}
-        ),
-        OptimInfo(
-            name='cadan',
-            opt_class=Adan,
-            description='Cautious Adaptive Nesterov Momentum Algorithm',
-            defaults={'caution': True, 'no_prox': False},
-            has_betas=True,
-            num_betas=3
-        ),
-        OptimInfo(
-            name='cadanw',
-            opt_class=Adan,
-            description='Cautious Adaptive Nesterov Momentum with decoupled weight decay',
-            defaults={'caution': True, 'no_prox': True},
-            has_betas=True,
-            num_betas=3
-        ),
-        OptimInfo(
-            name='cadoptw',
-            opt_class=Adopt,
-            description='Cautious AdoptW (decoupled decay)',
-            defaults={'decoupled': True, 'caution': True}
-        ),
-        OptimInfo(
-            name='clamb',
-            opt_class=Lamb,
-            description='Cautious LAMB',
-            has_betas=True,
-            defaults={'caution': True}
-        ),
-        OptimInfo(
-            name='clambw',
-            opt_class=Lamb,
-            description='Cautious LAMB with decoupled weight decay',
-            has_betas=True,
-            defaults={'caution': True, 'decoupled_decay': True}
-        ),
-        OptimInfo(
-            name='claprop',
-            opt_class=LaProp,
-            description='Cautious LaProp',
-            has_betas=True,
-            defaults={'caution': True}
-        ),
-        OptimInfo(
-            name='clion',
-            opt_class=Lion,
-            description='Cautious Lion',
-            has_eps=False,
-            has_betas=True,
-            defaults = {'caution': True}
-        ),
-        OptimInfo(
-            name='cmars',
-            opt_class=Mars,
-            description='Cautious MARS',
-            has_betas=True,
-            defaults={'caution': True}
-        ),
-        OptimInfo(
-            name='cnadamw',
-            opt_class=NAdamW,
-            description='Cautious NAdamW',
-            has_betas=True,
-            defaults={'caution': True}
-        ),
-        OptimInfo(
-            name='crmsproptf',
-            opt_class=RMSpropTF,
-            description='Cautious TensorFlow-style RMSprop',
-            has_momentum=True,
-            defaults={'alpha': 0.9, 'caution': True}
-        ),
-        OptimInfo(
-            name='csgdw',
-            opt_class=SGDW,
-            description='Cautious SGD with decoupled weight decay and Nesterov momentum',
-            has_eps=False,
-            has_momentum=True,
-            defaults={'nesterov': True, 'caution': True}
-        ),
-    ]
-    for opt in cautious_optimizers:
-        registry.register(opt)
-
-def _register_other_optimizers(registry: OptimizerRegistry) -> None:
-    """Register miscellaneous optimizers"""
-    other_optimizers = [
-        OptimInfo(
-            name='adabelief',
-            opt_class=AdaBelief,
-            description='Adapts learning rate based on gradient prediction error',
-            has_betas=True,
-            defaults={'rectify': False}
-        ),
-        OptimInfo(
-            name='radabelief',
-            opt_class=AdaBelief,
-            description='Rectified AdaBelief with variance adaptation',
-            has_betas=True,
-            defaults={'rectify': True}
-        ),
-        OptimInfo(
-            name='adadelta',
-            opt_class=torch.optim.Adadelta,
-            description='torch.optim.Adadelta, Adapts learning rates based on running windows of gradients'
-        ),
-        OptimInfo(
-            name='adagrad',
-            opt_class=torch.optim.Adagrad,
-            description='torch.optim.Adagrad, Adapts learning rates using cumulative squared gradients',
-            defaults={'eps': 1e-8}
-        ),
-        OptimInfo(
-            name='adan',
-            opt_class=Adan,
-            description='Adaptive Nesterov Momentum Algorithm',
-            defaults={'no_prox': False},
-            has_betas=True,
-            num_betas=3
-        ),
-        OptimInfo(
-            name='adanw',
-            opt_class=Adan,
-            description='Adaptive Nesterov Momentum with decoupled weight decay',
-            defaults={'no_prox': True},
-            has_betas=True,
-            num_betas=3
-        ),
-        OptimInfo(
-            name='adahessian',
-            opt_class=Adahessian,
-            description='An Adaptive Second Order Optimizer',
-            has_betas=True,
-            second_order=True,
-        ),
-        OptimInfo(
-            name='kron',
-            opt_class=Kron,
-            description='PSGD optimizer with Kronecker-factored preconditioner',
-            has_momentum=True,
-        ),
-        OptimInfo(
-            name='kronw',
-            opt_class=Kron,
-            description='PSGD optimizer with Kronecker-factored preconditioner and decoupled weight decay',
-            has_momentum=True,
-            defaults={'decoupled_decay': True}
-        ),
-        OptimInfo(
-            name='laprop',
-            opt_class=LaProp,
-            description='Separating Momentum and Adaptivity in Adam',
-            has_betas=True,
-        ),
-        OptimInfo(
-            name='lion',
-            opt_class=Lion,
-            description='Evolved Sign Momentum optimizer for improved convergence',
-            has_eps=False,
-            has_betas=True
-        ),
-        OptimInfo(
-            name='madgrad',
-            opt_class=MADGRAD,
-            description='Momentum-based Adaptive gradient method',
-            has_momentum=True
-        ),
-        OptimInfo(
-            name='madgradw',
-            opt_class=MADGRAD,
-            description='MADGRAD with decoupled weight decay',
-            has_momentum=True,
-            defaults={'decoupled_decay': True}
-        ),
-        OptimInfo(
-            name='mars',
-            opt_class=Mars,
-            description='Unleashing the Power of Variance Reduction for Training Large Models',
-            has_betas=True,
-        ),
-        OptimInfo(
-            name='novograd',
-            opt_class=NvNovoGrad,
-            description='Normalized Adam with L2 norm gradient normalization',
-            has_betas=True
-        ),
-        OptimInfo(
-            name='rmsprop',
-            opt_class=torch.optim.RMSprop,
-            description='torch.optim.RMSprop, Root Mean Square Propagation',
-            has_momentum=True,
-            defaults={'alpha': 0.9}
-        ),
-        OptimInfo(
-            name='rmsproptf',
-            opt_class=RMSpropTF,
-            description='TensorFlow-style RMSprop implementation, Root Mean Square Propagation',
-            has_momentum=True,
-            defaults={'alpha': 0.9}
-        ),
-    ]
-    for opt in other_optimizers:
-        registry.register(opt)
-    registry.register_foreach_default('lion')
-
-
-def _register_apex_optimizers(registry: OptimizerRegistry) -> None:
-    """Register APEX optimizers (lazy import)"""
-    apex_optimizers = [
-        OptimInfo(
-            name='fusedsgd',
-            opt_class='apex.optimizers.FusedSGD',
-            description='NVIDIA APEX fused SGD implementation for faster training',
-            has_eps=False,
-            has_momentum=True,
-            defaults={'nesterov': True}
-        ),
-        OptimInfo(
-            name='fusedadam',
-            opt_class='apex.optimizers.FusedAdam',
-            description='NVIDIA APEX fused Adam implementation',
-            has_betas=True,
-            defaults={'adam_w_mode': False}
-        ),
-        OptimInfo(
-            name='fusedadamw',
-            opt_class='apex.optimizers.FusedAdam',
-            description='NVIDIA APEX fused AdamW implementation',
-            has_betas=True,
-            defaults={'adam_w_mode': True}
-        ),
-        OptimInfo(
-            name='fusedlamb',
-            opt_class='apex.optimizers.FusedLAMB',
-            description='NVIDIA APEX fused LAMB implementation',
-            has_betas=True
-        ),
-        OptimInfo(
-            name='fusednovograd',
-            opt_class='apex.optimizers.FusedNovoGrad',
-            description='NVIDIA APEX fused NovoGrad implementation',
-            has_betas=True,
-            defaults={'betas': (0.95, 0.98)}
-        ),
-    ]
-    for opt in apex_optimizers:
-        registry.register(opt)
-
-
-def _register_bnb_optimizers(registry: OptimizerRegistry) -> None:
-    """Register bitsandbytes optimizers (lazy import)"""
-    bnb_optimizers = [
-        OptimInfo(
-            name='bnbsgd',
-            opt_class='bitsandbytes.optim.SGD',
-            description='bitsandbytes SGD',
-            has_eps=False,
-            has_momentum=True,
-            defaults={'nesterov': True}
-        ),
-        OptimInfo(
-            name='bnbsgd8bit',
-            opt_class='bitsandbytes.optim.SGD8bit',
-            description='bitsandbytes 8-bit SGD with dynamic quantization',
-            has_eps=False,
-            has_momentum=True,
-            defaults={'nesterov': True}
-        ),
-        OptimInfo(
-            name='bnbadam',
-            opt_class='bitsandbytes.optim.Adam',
-            description='bitsandbytes Adam',
-            has_betas=True
-        ),
-        OptimInfo(
-            name='bnbadam8bit',
-            opt_class='bitsandbytes.optim.Adam',
-            description='bitsandbytes 8-bit Adam with dynamic quantization',
-            has_betas=True
-        ),
-        OptimInfo(
-            name='bnbadamw',
-            opt_class='bitsandbytes.optim.AdamW',
-            description='bitsandbytes AdamW',
-            has_betas=True
-        ),
-        OptimInfo(
-            name='bnbadamw8bit',
-            opt_class='bitsandbytes.optim.AdamW',
-            description='bitsandbytes 8-bit AdamW with dynamic quantization',
-            has_betas=True
-        ),
-        OptimInfo(
-            'bnblion',
-            'bitsandbytes.optim.Lion',
-            description='bitsandbytes Lion',
-            has_eps=False,
-            has_betas=True
-        ),
-        OptimInfo(
-            'bnblion8bit',
-            'bitsandbytes.optim.Lion8bit',
-            description='bitsandbytes 8-bit Lion with dynamic quantization',
-            has_eps=False,
-            has_betas=True
-        ),
-        OptimInfo(
-            'bnbademamix',
-            'bitsandbytes.optim.AdEMAMix',
-            description='bitsandbytes AdEMAMix',
-            has_betas=True,
-            num_betas=3,
-        ),
-        OptimInfo(
-            'bnbademamix8bit',
-            'bitsandbytes.optim.AdEMAMix8bit',
-            description='bitsandbytes 8-bit AdEMAMix with dynamic quantization',
-            has_betas=True,
-            num_betas=3,
-        ),
-    ]
-    for opt in bnb_optimizers:
-        registry.register(opt)
+_DEFAULT_OPTIMIZERS: Tuple[OptimInfo, ...] = (
+    # SGD variants
+    OptimInfo(
+        name='sgd',
+        opt_class=torch.optim.SGD,
+        description='torch.Optim Stochastic Gradient Descent (SGD) with Nesterov momentum',
+        has_eps=False,
+        has_momentum=True,
+        defaults={'nesterov': True}
+    ),
+    OptimInfo(
+        name='momentum',
+        opt_class=torch.optim.SGD,
+        description='torch.Optim Stochastic Gradient Descent (SGD) with classical momentum',
+        has_eps=False,
+        has_momentum=True,
+        defaults={'nesterov': False}
+    ),
+    OptimInfo(
+        name='sgdp',
+        opt_class=_opt_class('timm.optim.sgdp.SGDP'),
+        description='SGD with built-in projection to unit norm sphere',
+        has_momentum=True,
+        defaults={'nesterov': True}
+    ),
+    OptimInfo(
+        name='sgdw',
+        opt_class=_opt_class('timm.optim.sgdw.SGDW'),
+        description='SGD with decoupled weight decay and Nesterov momentum',
+        has_eps=False,
+        has_momentum=True,
+        defaults={'nesterov': True}
+    ),
+    # Adam variants
+    OptimInfo(
+        name='adam',
+        opt_class=torch.optim.Adam,
+        description='torch.optim.Adam, Adaptive Moment Estimation',
+        has_betas=True
+    ),
+    OptimInfo(
+        name='adamw',
+        opt_class=torch.optim.AdamW,
+        description='torch.optim.AdamW, Adam with decoupled weight decay',
+        has_betas=True
+    ),
+    OptimInfo(
+        name='adamwlegacy',
+        opt_class=_opt_class('timm.optim.adamw.AdamWLegacy'),
+        description='legacy impl of AdamW that pre-dates inclusion to torch.optim',
+        has_betas=True
+    ),
+    OptimInfo(
+        name='adamp',
+        opt_class=_opt_class('timm.optim.adamp.AdamP'),
+        description='Adam with built-in projection to unit norm sphere',
+        has_betas=True,
+        defaults={'wd_ratio': 0.01, 'nesterov': True}
+    ),
+    OptimInfo(
+        name='nadam',
+        opt_class=torch.optim.NAdam,
+        description='torch.optim.NAdam, Adam with Nesterov momentum',
+        has_betas=True
+    ),
+    OptimInfo(
+        name='nadamlegacy',
+        opt_class=_opt_class('timm.optim.nadam.NAdamLegacy'),
+        description='legacy impl of NAdam that pre-dates inclusion in torch.optim',
+        has_betas=True
+    ),
+    OptimInfo(
+        name='nadamw',
+        opt_class=_opt_class('timm.optim.nadamw.NAdamW'),
+        description='Adam with Nesterov momentum and decoupled weight decay, mlcommons/algorithmic-efficiency impl',
+        has_betas=True
+    ),
+    OptimInfo(
+        name='radam',
+        opt_class=torch.optim.RAdam,
+        description='torch.optim.RAdam, Rectified Adam with variance adaptation',
+        has_betas=True
+    ),
+    OptimInfo(
+        name='radamlegacy',
+        opt_class=_opt_class('timm.optim.radam.RAdamLegacy'),
+        description='legacy impl of RAdam that predates inclusion in torch.optim',
+        has_betas=True
+    ),
+    OptimInfo(
+        name='radamw',
+        opt_class=torch.optim.RAdam,
+        description='torch.optim.RAdamW, Rectified Adam with variance adaptation and decoupled weight decay',
+        has_betas=True,
+        defaults={'decoupled_weight_decay': True}
+    ),
+    OptimInfo(
+        name='adamax',
+        opt_class=torch.optim.Adamax,
+        description='torch.optim.Adamax, Adam with infinity norm for more stable updates',
+        has_betas=True
+    ),
+    OptimInfo(
+        name='adafactor',
+        opt_class=_opt_class('timm.optim.adafactor.Adafactor'),
+        description='Memory-efficient implementation of Adam with factored gradients',
+    ),
+    OptimInfo(
+        name='adafactorbv',
+        opt_class=_opt_class('timm.optim.adafactor_bv.AdafactorBigVision'),
+        description='Big Vision variant of Adafactor with factored gradients, half precision momentum',
+    ),
+    OptimInfo(
+        name='adopt',
+        opt_class=_opt_class('timm.optim.adopt.Adopt'),
+        description='Modified Adam that can converge with any β2 with the optimal rate',
+    ),
+    OptimInfo(
+        name='adoptw',
+        opt_class=_opt_class('timm.optim.adopt.Adopt'),
+        description='Modified AdamW (decoupled decay) that can converge with any β2 with the optimal rate',
+        defaults={'decoupled': True}
+    ),
+    # LAMB / LARS variants
+    OptimInfo(
+        name='lamb',
+        opt_class=_opt_class('timm.optim.lamb.Lamb'),
+        description='Layer-wise Adaptive Moments for batch optimization',
+        has_betas=True
+    ),
+    OptimInfo(
+        name='lambc',
+        opt_class=_opt_class('timm.optim.lamb.Lamb'),
+        description='LAMB with trust ratio clipping for stability',
+        has_betas=True,
+        defaults={'trust_clip': True}
+    ),
+    OptimInfo(
+        name='lambw',
+        opt_class=_opt_class('timm.optim.lamb.Lamb'),
+        description='LAMB with decoupled weight decay',
+        has_betas=True,
+        defaults={'decoupled_decay': True}
+    ),
+    OptimInfo(
+        name='lambcw',
+        opt_class=_opt_class('timm.optim.lamb.Lamb'),
+        description='LAMB with trust ratio clipping for stability and decoupled decay',
+        has_betas=True,
+        defaults={'trust_clip': True, 'decoupled_decay': True}
+    ),
+    OptimInfo(
+        name='lars',
+        opt_class=_opt_class('timm.optim.lars.Lars'),
+        description='Layer-wise Adaptive Rate Scaling',
+        has_momentum=True
+    ),
+    OptimInfo(
+        name='larc',
+        opt_class=_opt_class('timm.optim.lars.Lars'),
+        description='LARS with trust ratio clipping for stability',
+        has_momentum=True,
+        defaults={'trust_clip': True}
+    ),
+    OptimInfo(
+        name='nlars',
+        opt_class=_opt_class('timm.optim.lars.Lars'),
+        description='LARS with Nesterov momentum',
+        has_momentum=True,
+        defaults={'nesterov': True}
+    ),
+    OptimInfo(
+        name='nlarc',
+        opt_class=_opt_class('timm.optim.lars.Lars'),
+        description='LARS with Nesterov momentum & trust ratio clipping',
+        has_momentum=True,
+        defaults={'nesterov': True, 'trust_clip': True}
+    ),
+    # Miscellaneous optimizers
+    OptimInfo(
+        name='adabelief',
+        opt_class=_opt_class('timm.optim.adabelief.AdaBelief'),
+        description='Adapts learning rate based on gradient prediction error',
+        has_betas=True,
+        defaults={'rectify': False}
+    ),
+    OptimInfo(
+        name='radabelief',
+        opt_class=_opt_class('timm.optim.adabelief.AdaBelief'),
+        description='Rectified AdaBelief with variance adaptation',
+        has_betas=True,
+        defaults={'rectify': True}
+    ),
+    OptimInfo(
+        name='adadelta',
+        opt_class=torch.optim.Adadelta,
+        description='torch.optim.Adadelta, Adapts learning rates based on running windows of gradients'
+    ),
+    OptimInfo(
+        name='adagrad',
+        opt_class=torch.optim.Adagrad,
+        description='torch.optim.Adagrad, Adapts learning rates using cumulative squared gradients',
+        defaults={'eps': 1e-8}
+    ),
+    OptimInfo(
+        name='adan',
+        opt_class=_opt_class('timm.optim.adan.Adan'),
+        description='Adaptive Nesterov Momentum Algorithm',
+        defaults={'no_prox': False},
+        has_betas=True,
+        num_betas=3
+    ),
+    OptimInfo(
+        name='adanw',
+        opt_class=_opt_class('timm.optim.adan.Adan'),
+        description='Adaptive Nesterov Momentum with decoupled weight decay',
+        defaults={'no_prox': True},
+        has_betas=True,
+        num_betas=3
+    ),
+    OptimInfo(
+        name='adahessian',
+        opt_class=_opt_class('timm.optim.adahessian.Adahessian'),
+        description='An Adaptive Second Order Optimizer',
+        has_betas=True,
+        second_order=True,
+    ),
+    OptimInfo(
+        name='kron',
+        opt_class=_opt_class('timm.optim.kron.Kron'),
+        description='PSGD optimizer with Kronecker-factored preconditioner',
+        has_momentum=True,
+    ),
+    OptimInfo(
+        name='kronw',
+        opt_class=_opt_class('timm.optim.kron.Kron'),
+        description='PSGD optimizer with Kronecker-factored preconditioner and decoupled weight decay',
+        has_momentum=True,
+        defaults={'decoupled_decay': True}
+    ),
+    OptimInfo(
+        name='laprop',
+        opt_class=_opt_class('timm.optim.laprop.LaProp'),
+        description='Separating Momentum and Adaptivity in Adam',
+        has_betas=True,
+    ),
+    OptimInfo(
+        name='lion',
+        opt_class=_opt_class('timm.optim.lion.Lion'),
+        description='Evolved Sign Momentum optimizer for improved convergence',
+        has_eps=False,
+        has_betas=True
+    ),
+    OptimInfo(
+        name='madgrad',
+        opt_class=_opt_class('timm.optim.madgrad.MADGRAD'),
+        description='Momentum-based Adaptive gradient method',
+        has_momentum=True
+    ),
+    OptimInfo(
+        name='madgradw',
+        opt_class=_opt_class('timm.optim.madgrad.MADGRAD'),
+        description='MADGRAD with decoupled weight decay',
+        has_momentum=True,
+        defaults={'decoupled_decay': True}
+    ),
+    OptimInfo(
+        name='mars',
+        opt_class=_opt_class('timm.optim.mars.Mars'),
+        description='Unleashing the Power of Variance Reduction for Training Large Models',
+        has_betas=True,
+    ),
+    OptimInfo(
+        name='novograd',
+        opt_class=_opt_class('timm.optim.nvnovograd.NvNovoGrad'),
+        description='Normalized Adam with L2 norm gradient normalization',
+        has_betas=True
+    ),
+    OptimInfo(
+        name='rmsprop',
+        opt_class=torch.optim.RMSprop,
+        description='torch.optim.RMSprop, Root Mean Square Propagation',
+        has_momentum=True,
+        defaults={'alpha': 0.9}
+    ),
+    OptimInfo(
+        name='rmsproptf',
+        opt_class=_opt_class('timm.optim.rmsprop_tf.RMSpropTF'),
+        description='TensorFlow-style RMSprop implementation, Root Mean Square Propagation',
+        has_momentum=True,
+        defaults={'alpha': 0.9}
+    ),
+    # NVIDIA APEX optimizers (lazy import)
+    OptimInfo(
+        name='fusedsgd',
+        opt_class='apex.optimizers.FusedSGD',
+        description='NVIDIA APEX fused SGD implementation for faster training',
+        has_eps=False,
+        has_momentum=True,
+        defaults={'nesterov': True}
+    ),
+    OptimInfo(
+        name='fusedadam',
+        opt_class='apex.optimizers.FusedAdam',
+        description='NVIDIA APEX fused Adam implementation',
+        has_betas=True,
+        defaults={'adam_w_mode': False}
+    ),
+    OptimInfo(
+        name='fusedadamw',
+        opt_class='apex.optimizers.FusedAdam',
+        description='NVIDIA APEX fused AdamW implementation',
+        has_betas=True,
+        defaults={'adam_w_mode': True}
+    ),
+    OptimInfo(
+        name='fusedlamb',
+        opt_class='apex.optimizers.FusedLAMB',
+        description='NVIDIA APEX fused LAMB implementation',
+        has_betas=True
+    ),
+    OptimInfo(
+        name='fusednovograd',
+        opt_class='apex.optimizers.FusedNovoGrad',
+        description='NVIDIA APEX fused NovoGrad implementation',
+        has_betas=True,
+        defaults={'betas': (0.95, 0.98)}
+    ),
+    # bitsandbytes optimizers (lazy import)
+    OptimInfo(
+        name='bnbsgd',
+        opt_class='bitsandbytes.optim.SGD',
+        description='bitsandbytes SGD',
+        has_eps=False,
+        has_momentum=True,
+        defaults={'nesterov': True}
+    ),
+    OptimInfo(
+        name='bnbsgd8bit',
+        opt_class='bitsandbytes.optim.SGD8bit',
+        description='bitsandbytes 8-bit SGD with dynamic quantization',
+        has_eps=False,
+        has_momentum=True,
+        defaults={'nesterov': True}
+    ),
+    OptimInfo(
+        name='bnbadam',
+        opt_class='bitsandbytes.optim.Adam',
+        description='bitsandbytes Adam',
+        has_betas=True
+    ),
+    OptimInfo(
+        name='bnbadam8bit',
+        opt_class='bitsandbytes.optim.Adam',
+        description='bitsandbytes 8-bit Adam with dynamic quantization',
+        has_betas=True
+    ),
+    OptimInfo(
+        name='bnbadamw',
+        opt_class='bitsandbytes.optim.AdamW',
+        description='bitsandbytes AdamW',
+        has_betas=True
+    ),
+    OptimInfo(
+        name='bnbadamw8bit',
+        opt_class='bitsandbytes.optim.AdamW',
+        description='bitsandbytes 8-bit AdamW with dynamic quantization',
+        has_betas=True
+    ),
+    OptimInfo(
+        'bnblion',
+        'bitsandbytes.optim.Lion',
+        description='bitsandbytes Lion',
+        has_eps=False,
+        has_betas=True
+    ),
+    OptimInfo(
+        'bnblion8bit',
+        'bitsandbytes.optim.Lion8bit',
+        description='bitsandbytes 8-bit Lion with dynamic quantization',
+        has_eps=False,
+        has_betas=True
+    ),
+    OptimInfo(
+        'bnbademamix',
+        'bitsandbytes.optim.AdEMAMix',
+        description='bitsandbytes AdEMAMix',
+        has_betas=True,
+        num_betas=3,
+    ),
+    OptimInfo(
+        'bnbademamix8bit',
+        'bitsandbytes.optim.AdEMAMix8bit',
+        description='bitsandbytes 8-bit AdEMAMix with dynamic quantization',
+        has_betas=True,
+        num_betas=3,
+    ),
+    # Cautious variants
+    OptimInfo(
+        name='cadafactor',
+        opt_class=_opt_class('timm.optim.adafactor.Adafactor'),
+        description='Cautious Adafactor',
+        defaults={'caution': True}
+    ),
+    OptimInfo(
+        name='cadafactorbv',
+        opt_class=_opt_class('timm.optim.adafactor_bv.AdafactorBigVision'),
+        description='Cautious Big Vision Adafactor',
+        defaults={'caution': True}
+    ),
+    OptimInfo(
+        name='cadamw',
+        opt_class=_opt_class('timm.optim.adamw.AdamWLegacy'),
+        description='Cautious AdamW',
+        has_betas=True,
+        defaults={'caution': True}
+    ),
+    OptimInfo(
+        name='cadopt',
+        opt_class=_opt_class('timm.optim.adopt.Adopt'),
+        description='Cautious Adopt',
+        defaults={'caution': True}
+    ),
+    OptimInfo(
+        name='cadan',
+        opt_class=_opt_class('timm.optim.adan.Adan'),
+        description='Cautious Adaptive Nesterov Momentum Algorithm',
+        defaults={'caution': True, 'no_prox': False},
+        has_betas=True,
+        num_betas=3
+    ),
+    OptimInfo(
+        name='cadanw',
+        opt_class=_opt_class('timm.optim.adan.Adan'),
+        description='Cautious Adaptive Nesterov Momentum with decoupled weight decay',
+        defaults={'caution': True, 'no_prox': True},
+        has_betas=True,
+        num_betas=3
+    ),
+    OptimInfo(
+        name='cadoptw',
+        opt_class=_opt_class('timm.optim.adopt.Adopt'),
+        description='Cautious AdoptW (decoupled decay)',
+        defaults={'decoupled': True, 'caution': True}
+    ),
+    OptimInfo(
+        name='clamb',
+        opt_class=_opt_class('timm.optim.lamb.Lamb'),
+        description='Cautious LAMB',
+        has_betas=True,
+        defaults={'caution': True}
+    ),
+    OptimInfo(
+        name='clambw',
+        opt_class=_opt_class('timm.optim.lamb.Lamb'),
+        description='Cautious LAMB with decoupled weight decay',
+        has_betas=True,
+        defaults={'caution': True, 'decoupled_decay': True}
+    ),
+    OptimInfo(
+        name='claprop',
+        opt_class=_opt_class('timm.optim.laprop.LaProp'),
+        description='Cautious LaProp',
+        has_betas=True,
+        defaults={'caution': True}
+    ),
+    OptimInfo(
+        name='clion',
+        opt_class=_opt_class('timm.optim.lion.Lion'),
+        description='Cautious Lion',
+        has_eps=False,
+        has_betas=True,
+        defaults = {'caution': True}
+    ),
+    OptimInfo(
+        name='cmars',
+        opt_class=_opt_class('timm.optim.mars.Mars'),
+        description='Cautious MARS',
+        has_betas=True,
+        defaults={'caution': True}
+    ),
+    OptimInfo(
+        name='cnadamw',
+        opt_class=_opt_class('timm.optim.nadamw.NAdamW'),
+        description='Cautious NAdamW',
+        has_betas=True,
+        defaults={'caution': True}
+    ),
+    OptimInfo(
+        name='crmsproptf',
+        opt_class=_opt_class('timm.optim.rmsprop_tf.RMSpropTF'),
+        description='Cautious TensorFlow-style RMSprop',
+        has_momentum=True,
+        defaults={'alpha': 0.9, 'caution': True}
+    ),
+    OptimInfo(
+        name='csgdw',
+        opt_class=_opt_class('timm.optim.sgdw.SGDW'),
+        description='Cautious SGD with decoupled weight decay and Nesterov momentum',
+        has_eps=False,
+        has_momentum=True,
+        defaults={'nesterov': True, 'caution': True}
+    ),
+)
 
 
 default_registry = OptimizerRegistry()
 
 def _register_default_optimizers() -> None:
     """Register all default optimizers to the global registry."""
-    # Register all optimizer groups
-    _register_sgd_variants(default_registry)
-    _register_adam_variants(default_registry)
-    _register_lamb_lars(default_registry)
-    _register_other_optimizers(default_registry)
-    _register_apex_optimizers(default_registry)
-    _register_bnb_optimizers(default_registry)
-    _register_cautious_optimizers(default_registry)
+    # Bulk install, no collisions possible in the default set so skip per-entry register() checks
+    default_registry.bulk_register(_DEFAULT_OPTIMIZERS)
+    default_registry.register_foreach_default('lion')
 
     # Register aliases
     default_registry.register_alias('nesterov', 'sgd')
@@ -1103,16 +1130,29 @@ def optimizer_kwargs(cfg):
         weight_decay=cfg.weight_decay,
         momentum=cfg.momentum,
     )
-    if getattr(cfg, 'opt_eps', None) is not None:
-        kwargs['eps'] = cfg.opt_eps
-    if getattr(cfg, 'opt_betas', None) is not None:
-        kwargs['betas'] = cfg.opt_betas
-    if getattr(cfg, 'layer_decay', None) is not None:
-        kwargs['layer_decay'] = cfg.layer_decay
-    if getattr(cfg, 'opt_args', None) is not None:
-        kwargs.update(cfg.opt_args)
-    if getattr(cfg, 'opt_foreach', None) is not None:
-        kwargs['foreach'] = cfg.opt_foreach
+
+    # Pull the cfg attribute dict once so optional args resolve via dict.get instead of
+    # repeated getattr probes (AttributeError slow path) against argparse Namespace objects.
+    cfg_dict = vars(cfg) if hasattr(cfg, '__dict__') else {}
+
+    def _cfg_get(key):
+        return cfg_dict[key] if key in cfg_dict else getattr(cfg, key, None)
+
+    opt_eps = _cfg_get('opt_eps')
+    if opt_eps is not None:
+        kwargs['eps'] = opt_eps
+    opt_betas = _cfg_get('opt_betas')
+    if opt_betas is not None:
+        kwargs['betas'] = opt_betas
+    layer_decay = _cfg_get('layer_decay')
+    if layer_decay is not None:
+        kwargs['layer_decay'] = layer_decay
+    opt_args = _cfg_get('opt_args')
+    if opt_args is not None:
+        kwargs.update(opt_args)
+    opt_foreach = _cfg_get('opt_foreach')
+    if opt_foreach is not None:
+        kwargs['foreach'] = opt_foreach
     return kwargs
 
 
@@ -15,7 +15,7 @@ def param_groups_weight_decay(
         weight_decay: float = 1e-5,
         no_weight_decay_list: Collection[str] = (),
 ):
-    no_weight_decay_list = set(no_weight_decay_list)
+    no_weight_decay_list = frozenset(no_weight_decay_list)
     decay = []
     no_decay = []
     for name, param in model.named_parameters():
@@ -79,7 +79,7 @@ def param_groups_layer_decay(
     Parameter groups for layer-wise lr decay & weight decay
     Based on BEiT: https://github.com/microsoft/unilm/blob/master/beit/optim_factory.py#L58
     """
-    no_weight_decay_list = set(no_weight_decay_list)
+    no_weight_decay_list = frozenset(no_weight_decay_list)
     param_group_names = {}  # NOTE for debugging
     param_groups = {}
 